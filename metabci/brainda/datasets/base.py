@@ -9,12 +9,15 @@ Basic elements to describe a BCI dataset.
 Modified from https://github.com/NeuroTechX/moabb
 """
 from abc import ABCMeta, abstractmethod
-from typing import Union, Optional, Dict, List, Tuple
+from typing import Union, Optional, Dict, List, Tuple, Hashable
 from pathlib import Path
 
+from joblib import Parallel, delayed
 from mne.io import Raw
 from mne.utils import verbose
 
+from ..utils import mne_update_path
+
 
 class BaseDataset(metaclass=ABCMeta):
     """BaseDataset for all datasets."""
@@ -221,6 +224,119 @@ class BaseDataset(metaclass=ABCMeta):
                 update_path=True,
             )
 
+    def prefetch(
+            self,
+            subjects: Optional[List[Union[int, str]]] = None,
+            path: Optional[Union[str, Path]] = None,
+            force_update: bool = False,
+            proxies: Optional[Dict[str, str]] = None,
+            n_jobs: int = -1,
+            verbose: Optional[Union[bool, str, int]] = None,
+    ):
+        """Download and decompress subject files in parallel.
+
+        Subjects are grouped by the archive holding their data, see
+        _get_archive_key. Each group is fetched by a single job, one subject
+        after another, so no archive is downloaded or extracted by two jobs at
+        once, and force_update only applies to the first subject of a group.
+        The mne config is updated with the given path before any job starts,
+        then all groups are fetched by parallel jobs.
+
+        Parameters
+        ----------
+        subjects : Optional[List[Union[int, str]]], optional
+            subjects to fetch, by default all subjects
+        path : Optional[Union[str, Path]], optional
+            Location of where to look for the data storing location.
+            If None, the environment variable or config parameter
+            ``MNE_DATASETS_(dataset_code)_PATH`` is used. If it doesn't exist, the
+            "~/mne_data" directory is used. If the dataset is not found under the given path,
+            the data will be automatically downloaded to the specified folder, by default None
+        force_update : bool, optional
+            force update of the dataset even if a local copy exists, by default False
+        proxies: Optional[Union[bool, str, int]], optional
+            proxies if needed
+        n_jobs : int, optional
+            Parallel jobs, by default -1
+        verbose : Optional[Union[bool, str, int]], optional
+            [description], by default None
+        """
+        if subjects is None:
+            subjects = self.subjects
+
+        groups: Dict[Hashable, List[Union[int, str]]] = dict()
+        for subject in subjects:
+            if subject not in self.subjects:
+                raise ValueError("Invalid subject {} given".format(subject))
+            groups.setdefault(self._get_archive_key(subject), []).append(subject)
+        if len(groups) == 0:
+            return
+
+        mne_update_path(self._get_path_sign(), path=path, update_path=True)
+        Parallel(n_jobs=n_jobs)(
+            delayed(self._prefetch_group)(
+                group_subjects,
+                path=path,
+                force_update=force_update,
+                update_path=False,
+                proxies=proxies,
+                verbose=verbose,
+            )
+            for group_subjects in groups.values()
+        )
+
+    def _get_path_sign(self) -> str:
+        """Sign passed to mne_data_path by data_path, by default dataset_code.
+
+        Datasets storing their files under another sign must override this,
+        prefetch uses it to update the mne config before fetching.
+
+        Returns
+        -------
+        str
+            the unique identifier to which the files belong
+        """
+        return self.dataset_code
+
+    def _get_archive_key(self, subject: Union[int, str]) -> Hashable:
+        """Identify the downloaded file or archive holding a subject.
+
+        Subjects with the same key are never fetched concurrently by prefetch.
+        Datasets bundling several subjects in one file must override this,
+        by default every subject has its own files.
+
+        Parameters
+        ----------
+        subject : Union[int, str]
+            subject id
+
+        Returns
+        -------
+        Hashable
+            key of the file or archive
+        """
+        return subject
+
+    def _prefetch_group(
+            self,
+            subjects: List[Union[int, str]],
+            path: Optional[Union[str, Path]] = None,
+            force_update: bool = False,
+            update_path: Optional[bool] = None,
+            proxies: Optional[Dict[str, str]] = None,
+            verbose: Optional[Union[bool, str, int]] = None,
+    ):
+        """Fetch subjects sharing one archive, see prefetch."""
+        for i, subject in enumerate(subjects):
+            self.data_path(
+                subject,
+                path=path,
+                force_update=force_update and i == 0,
+                update_path=update_path,
+                proxies=proxies,
+                verbose=verbose,
+            )
+
 
 class BaseTimeEncodingDataset(BaseDataset):
     def __init__(self,
@@ -106,6 +106,9 @@ class BNCI2014001(BaseDataset):
             paradigm="imagery",
         )
 
+    def _get_path_sign(self) -> str:
+        return "bnci"
+
     def data_path(
         self,
         subject: Union[str, int],
@@ -267,6 +270,9 @@ class BNCI2014004(BaseDataset):
             paradigm="imagery",
         )
 
+    def _get_path_sign(self) -> str:
+        return "bnci"
+
     def data_path(
         self,
         subject: Union[str, int],
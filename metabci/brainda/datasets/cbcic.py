@@ -114,6 +114,9 @@ class CBCIC2019001(BaseDataset):
             paradigm="imagery",
         )
 
+    def _get_path_sign(self) -> str:
+        return "cbcic"
+
     def data_path(
         self,
         subject: Union[str, int],
@@ -274,6 +277,9 @@ class CBCIC2019004(BaseDataset):
             paradigm="imagery",
         )
 
+    def _get_path_sign(self) -> str:
+        return "cbcic"
+
     def data_path(
         self,
         subject: Union[str, int],
@@ -8,7 +8,8 @@ Tsinghua BCI Lab.
 """
 import os
 import tarfile
-from typing import Union, Optional, Dict, List, cast
+from functools import lru_cache
+from typing import Union, Optional, Dict, List, Callable, cast
 from pathlib import Path
 
 import numpy as np
@@ -32,6 +33,242 @@ BETA_URL = "http://bci.med.tsinghua.edu.cn/upload/liubingchuan/"  # 403 error
 # BETA_URL = "https://bci.med.tsinghua.edu.cn/upload/liubingchuan_BETA_wof/"
 # BETA_URL = 'https://figshare.com/articles/The_BETA_database/12264401'
 
+_TSINGHUA_CHANNELS = [
+    "FP1", "FPZ", "FP2", "AF3", "AF4", "F7", "F5", "F3", "F1", "FZ", "F2",
+    "F4", "F6", "F8", "FT7", "FC5", "FC3", "FC1", "FCZ", "FC2", "FC4",
+    "FC6", "FT8", "T7", "C5", "C3", "C1", "CZ", "C2", "C4", "C6", "T8",
+    "TP7", "CP5", "CP3", "CP1", "CPZ", "CP2", "CP4", "CP6", "TP8", "P7",
+    "P5", "P3", "P1", "PZ", "P2", "P4", "P6", "P8", "PO7", "PO5", "PO3",
+    "POZ", "PO4", "PO6", "PO8", "O1", "OZ", "O2",
+]
+
+# channels in the order of the mat files, the scalp channels interleaved with
+# M1, M2, CB1 and CB2, followed by the stim channel built at load time
+_CH_NAMES = (
+    *_TSINGHUA_CHANNELS[:32], "M1",
+    *_TSINGHUA_CHANNELS[32:41], "M2",
+    *_TSINGHUA_CHANNELS[41:57], "CB1",
+    *_TSINGHUA_CHANNELS[57:], "CB2",
+    "STI 014",
+)
+_CH_TYPES = tuple(
+    "misc" if ch_name in ("CB1", "CB2") else "stim" if ch_name == "STI 014" else "eeg"
+    for ch_name in _CH_NAMES
+)
+
+
+@lru_cache(maxsize=1)
+def _upper_standard_1005():
+    """standard_1005 montage with uppercase channel names, built once."""
+    montage = make_standard_montage("standard_1005")
+    montage.rename_channels(
+        {ch_name: ch_name.upper() for ch_name in montage.ch_names}
+    )
+    return montage
+
+
+@lru_cache(maxsize=None)
+def _tsinghua_info_and_montage(srate: Union[float, int]):
+    """Build the measurement info and montage shared by Tsinghua datasets.
+
+    Both are identical for every subject, so they are built once per process.
+    RawArray copies the info it is given and set_montage copies the montage,
+    so the cached objects are never modified.
+
+    Parameters
+    ----------
+    srate : Union[float, int]
+        sampling rate
+
+    Returns
+    -------
+    Tuple[Info, DigMontage]
+        info with 64 eeg/misc channels plus the STI 014 stim channel, and the
+        standard_1005 montage with uppercase channel names
+    """
+    info = create_info(ch_names=list(_CH_NAMES),
+                       ch_types=list(_CH_TYPES), sfreq=srate)
+    return info, _upper_standard_1005()
+
+
+def _pack_block(block: np.ndarray, out: np.ndarray, labels: np.ndarray):
+    """Pack one block of epochs into a continuous run buffer.
+
+    Parameters
+    ----------
+    block : np.ndarray
+        epochs in microvolts, shape (n_channels, n_times, n_trials)
+    out : np.ndarray
+        run buffer, shape (n_channels + 1, n_trials * n_times), trials are
+        written one after another in volts and the stim channel goes last
+    labels : np.ndarray
+        event label of each trial
+    """
+    n_channels, n_times, n_trials = block.shape
+    # scale the block straight into a reshaped view of the buffer,
+    # so neither the subject array nor the block is copied twice
+    np.multiply(
+        np.transpose(block, (0, 2, 1)),
+        1e-6,
+        out=out[:-1].reshape(n_channels, n_trials, n_times),
+    )
+    # insert event label at stimulus-onset
+    # 0.5s latency
+    out[-1] = 0
+    out[-1, 125::n_times] = labels
+
+
+# bump whenever _pack_epochs changes its output, so stale caches are ignored
+_RUNS_CACHE_VERSION = 1
+
+
+def _runs_cache_file(mat_file: Union[str, Path]) -> str:
+    return "{}.runs-v{:d}.npy".format(mat_file, _RUNS_CACHE_VERSION)
+
+
+def _runs_stamp_file(mat_file: Union[str, Path]) -> str:
+    return "{}.stamp".format(_runs_cache_file(mat_file))
+
+
+def _mat_stamp(mat_file: Union[str, Path]) -> str:
+    # extraction restores the archived mtime, which can be older than the
+    # cache, so a re-extracted mat file is only detected by an exact match
+    stat = os.stat(mat_file)
+    return "{:d} {:d}".format(stat.st_size, stat.st_mtime_ns)
+
+
+def _load_cached_runs(mat_file: Union[str, Path]) -> Optional[np.ndarray]:
+    """Load the run data cached next to a subject mat file.
+
+    Parameters
+    ----------
+    mat_file : Union[str, Path]
+        subject mat file
+
+    Returns
+    -------
+    Optional[np.ndarray]
+        memory-mapped (n_blocks, n_channels, n_samples) run data in volts with
+        the stim channel last, None if there is no usable cache or the mat
+        file changed since it was written
+    """
+    cache_file = _runs_cache_file(mat_file)
+    try:
+        with open(_runs_stamp_file(mat_file), "r") as f:
+            if f.read() != _mat_stamp(mat_file):
+                return None
+        # copy-on-write, so raws can still be modified in place
+        data = np.load(cache_file, mmap_mode="c")
+    except (OSError, ValueError):
+        return None
+    if (data.dtype != np.float64
+            or data.ndim != 3
+            or data.shape[1] != len(_CH_NAMES)):
+        return None
+    # handed out as a plain ndarray, mne removes the file behind a
+    # memmap-backed raw
+    return data.view(np.ndarray)
+
+
+def _save_cached_runs(mat_file: Union[str, Path], data: np.ndarray):
+    """Cache run data next to a subject mat file, see _load_cached_runs."""
+    cache_file = _runs_cache_file(mat_file)
+    stamp_file = _runs_stamp_file(mat_file)
+    tmp_file = "{}.tmp".format(cache_file)
+    try:
+        # the stamp goes first and comes back last, so a cache is never
+        # matched to a mat file it was not built from
+        if os.path.exists(stamp_file):
+            os.remove(stamp_file)
+        with open(tmp_file, "wb") as f:
+            np.save(f, data)
+        os.replace(tmp_file, cache_file)
+        with open(stamp_file, "w") as f:
+            f.write(_mat_stamp(mat_file))
+    except OSError:
+        # e.g. a read-only data folder, the mat file is parsed again next time
+        pass
+
+
+def _pack_epochs(epoch_data: np.ndarray, block_axis: int) -> np.ndarray:
+    """Pack the epochs of all blocks into continuous run data.
+
+    Parameters
+    ----------
+    epoch_data : np.ndarray
+        epochs in microvolts, shape (n_channels, n_times, ...) with the last
+        two axes indexing trials and blocks, in either order
+    block_axis : int
+        axis of epoch_data indexing blocks
+
+    Returns
+    -------
+    np.ndarray
+        run data in volts, shape (n_blocks, n_channels + 1, n_trials * n_times)
+        with the stim channel last
+    """
+    # a view, each block is then (n_channels, n_times, n_trials)
+    epoch_data = np.moveaxis(epoch_data, block_axis, -1)
+    n_channels, n_times, n_trials, n_blocks = epoch_data.shape
+
+    # one allocation serves all runs, each run being a contiguous slab
+    # holding both eeg and stim channels, no concatenation needed;
+    # RawArray stores float64 and would copy any other dtype
+    data = np.empty(
+        (n_blocks, n_channels + 1, n_trials * n_times), dtype=np.float64)
+
+    # trials are ordered by target within each run
+    labels = np.arange(1, n_trials + 1, dtype=data.dtype)
+
+    for i in range(n_blocks):
+        _pack_block(epoch_data[..., i], data[i], labels)
+    return data
+
+
+def _load_runs(
+    mat_file: Union[str, Path],
+    read_epoch_data: Callable[[Union[str, Path]], np.ndarray],
+    block_axis: int,
+    srate: Union[float, int],
+    cache_runs: bool = False,
+) -> Dict[str, Raw]:
+    """Load a subject of the Tsinghua datasets as one raw per block.
+
+    Parameters
+    ----------
+    mat_file : Union[str, Path]
+        subject mat file
+    read_epoch_data : Callable[[Union[str, Path]], np.ndarray]
+        reads the epoch tensor from mat_file, only called when there is no
+        valid run cache
+    block_axis : int
+        axis of the epoch tensor indexing blocks
+    srate : Union[float, int]
+        sampling rate
+    cache_runs : bool, optional
+        whether to cache the packed run data next to mat_file, by default False
+
+    Returns
+    -------
+    Dict[str, Raw]
+        {'run_id': Raw}
+    """
+    data = _load_cached_runs(mat_file) if cache_runs else None
+    if data is None:
+        data = _pack_epochs(read_epoch_data(mat_file), block_axis)
+        if cache_runs:
+            _save_cached_runs(mat_file, data)
+
+    info, montage = _tsinghua_info_and_montage(srate)
+    runs = dict()
+    for i in range(data.shape[0]):
+        # data[i] is a C-contiguous float64 slab, which RawArray keeps as
+        # its _data without copying, only the info is copied
+        raw = RawArray(data=data[i], info=info)
+        raw.set_montage(montage)
+        runs["run_{:d}".format(i)] = raw
+    return runs
+
 
 class Wang2016(BaseDataset):
     """SSVEP dataset from Yijun Wang.
@@ -88,39 +325,39 @@ class Wang2016(BaseDataset):
     8.6  9.6 10.6 11.6 12.6 13.6 14.6 15.6
     8.8  9.8 10.8 11.8 12.8 13.8 14.8 15.8
 
+    Parameters
+    ----------
+    cache_runs : bool, optional
+        if True, the packed run data of a subject is saved next to its mat
+        file on the first load (about 190 MB per subject) and memory-mapped on
+        later loads instead of parsing the mat file, by default False
+
     Notes
     -----
     1. sub5 is not available from the download url.
     """
 
-    _CHANNELS = [
-        "FP1", "FPZ", "FP2", "AF3", "AF4", "F7", "F5", "F3", "F1", "FZ", "F2",
-        "F4", "F6", "F8", "FT7", "FC5", "FC3", "FC1", "FCZ", "FC2", "FC4",
-        "FC6", "FT8", "T7", "C5", "C3", "C1", "CZ", "C2", "C4", "C6", "T8",
-        "TP7", "CP5", "CP3", "CP1", "CPZ", "CP2", "CP4", "CP6", "TP8", "P7",
-        "P5", "P3", "P1", "PZ", "P2", "P4", "P6", "P8", "PO7", "PO5", "PO3",
-        "POZ", "PO4", "PO6", "PO8", "O1", "OZ", "O2",
-    ]
+    _CHANNELS = _TSINGHUA_CHANNELS
 
-    _FREQS = [
+    _FREQS = (
         8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0,
         8.2, 9.2, 10.2, 11.2, 12.2, 13.2, 14.2, 15.2,
         8.4, 9.4, 10.4, 11.4, 12.4, 13.4, 14.4, 15.4,
         8.6, 9.6, 10.6, 11.6, 12.6, 13.6, 14.6, 15.6,
         8.8, 9.8, 10.8, 11.8, 12.8, 13.8, 14.8, 15.8,
-    ]
+    )
 
-    _PHASES = [
+    _PHASES = (
         0.0, 0.5, 1.0, 1.5, 0.0, 0.5, 1.0, 1.5,
         0.5, 1.0, 1.5, 0.0, 0.5, 1.0, 1.5, 0.0,
         1.0, 1.5, 0.0, 0.5, 1.0, 1.5, 0.0, 0.5,
         1.5, 0.0, 0.5, 1.0, 1.5, 0.0, 0.5, 1.0,
         0.0, 0.5, 1.0, 1.5, 0.0, 0.5, 1.0, 1.5,
-    ]
+    )
 
     _EVENTS = {str(freq): (i + 1, (0, 5)) for i, freq in enumerate(_FREQS)}
 
-    def __init__(self):
+    def __init__(self, cache_runs: bool = False):
         super().__init__(
             dataset_code="wang2016",
             subjects=list(range(1, 36)),
@@ -129,6 +366,12 @@ class Wang2016(BaseDataset):
             srate=250,
             paradigm="ssvep",
         )
+        # resolved local files of loaded subjects
+        self._subject_dests: Dict[Union[str, int], List[List[Union[str, Path]]]] = dict()
+        self.cache_runs = cache_runs
+
+    def _get_path_sign(self) -> str:
+        return "tsinghua"
 
     def data_path(
         self,
@@ -154,52 +397,43 @@ class Wang2016(BaseDataset):
         )
 
         subject_file = file_dest[:-3]
-        if not os.path.exists(subject_file):
+        # the sentinel is only written after a complete extraction, so an
+        # interrupted one is redone instead of leaving a truncated mat file,
+        # and a mat file removed later is extracted again
+        sentinel = Path(file_dest + ".done")
+        if not sentinel.exists() and os.path.exists(subject_file):
+            # mat files extracted before the sentinel existed are adopted when
+            # their size matches the archive listing, which only reads the
+            # archive header instead of decompressing it again
+            with py7zr.SevenZipFile(file_dest, "r") as archive:
+                sizes = {info.filename: info.uncompressed for info in archive.list()}
+            if sizes.get(os.path.basename(subject_file)) == os.path.getsize(subject_file):
+                sentinel.touch()
+        if not (sentinel.exists() and os.path.exists(subject_file)):
             # decompression the data
             with py7zr.SevenZipFile(file_dest, "r") as archive:
                 archive.extractall(path=Path(file_dest).parent)
+            sentinel.touch()
         dests = [[subject_file]]
         return dests
 
     def _get_single_subject_data(
         self, subject: Union[str, int], verbose: Optional[Union[bool, str, int]] = None
     ) -> Dict[str, Dict[str, Raw]]:
-        dests = self.data_path(subject)
-        raw_mat = loadmat(dests[0][0])
-        epoch_data = raw_mat["data"] * 1e-6
-        stim = np.zeros((1, *epoch_data.shape[1:]))
-        # insert event label at stimulus-onset
-        # 0.5s latency
-        stim[0, 125] = np.tile(
-            np.arange(1, 41)[:, np.newaxis], (1, epoch_data.shape[-1])
+        # skip data_path, which stats the download and archive, once the
+        # subject file is known; a file that went missing goes back through
+        # data_path, which extracts it again
+        dests = self._subject_dests.get(subject)
+        if dests is None or not os.path.exists(dests[0][0]):
+            dests = self.data_path(subject)
+            self._subject_dests[subject] = dests
+        runs = _load_runs(
+            dests[0][0],
+            lambda mat_file: loadmat(mat_file, variable_names=["data"])["data"],
+            block_axis=3,
+            srate=self.srate,
+            cache_runs=self.cache_runs,
         )
-        epoch_data = np.concatenate((epoch_data, stim), axis=0)
-        data = np.transpose(epoch_data, (0, 3, 2, 1))
-
-        montage = make_standard_montage("standard_1005")
-        montage.rename_channels(
-            {ch_name: ch_name.upper() for ch_name in montage.ch_names}
-        )
-        ch_names = [ch_name.upper() for ch_name in self._CHANNELS]
-        ch_names.insert(32, "M1")
-        ch_names.insert(42, "M2")
-        ch_names.insert(59, "CB1")
-        ch_names = ch_names + ["CB2", "STI 014"]
-        ch_types = ["eeg"] * 65
-        ch_types[59] = "misc"
-        ch_types[63] = "misc"
-        ch_types[-1] = "stim"
-
-        info = create_info(ch_names=ch_names,
-                           ch_types=ch_types, sfreq=self.srate)
-
-        runs = dict()
-        for i in range(data.shape[1]):
-            raw_data = np.reshape(data[:, i, ...], (data.shape[0], -1))
-            raw = RawArray(data=raw_data, info=info)
-            raw.set_montage(montage)
-            runs["run_{:d}".format(i)] = raw
-
         sess = {"session_0": runs}
         return sess
 
@@ -234,39 +468,39 @@ class BETA(BaseDataset):
 
     3-100Hz bandpass filtering (eegfilt), downsampled to 250 Hz
 
+    Parameters
+    ----------
+    cache_runs : bool, optional
+        if True, the packed run data of a subject is saved next to its mat
+        file on the first load (about 60 MB per subject) and memory-mapped on
+        later loads instead of parsing the mat file, by default False
+
     References
     ----------
     .. [1] Liu B, Huang X, Wang Y, et al. BETA: A Large Benchmark Database
     Toward SSVEP-BCI Application[J]. Frontiers in neuroscience, 2020, 14: 627.
     """
 
-    _CHANNELS = [
-        "FP1", "FPZ", "FP2", "AF3", "AF4", "F7", "F5", "F3", "F1", "FZ", "F2",
-        "F4", "F6", "F8", "FT7", "FC5", "FC3", "FC1", "FCZ", "FC2", "FC4",
-        "FC6", "FT8", "T7", "C5", "C3", "C1", "CZ", "C2", "C4", "C6", "T8",
-        "TP7", "CP5", "CP3", "CP1", "CPZ", "CP2", "CP4", "CP6", "TP8", "P7",
-        "P5", "P3", "P1", "PZ", "P2", "P4", "P6", "P8", "PO7", "PO5", "PO3",
-        "POZ", "PO4", "PO6", "PO8", "O1", "OZ", "O2",
-    ]
+    _CHANNELS = _TSINGHUA_CHANNELS
 
-    _FREQS = [
+    _FREQS = (
         8.6, 8.8, 9.0, 9.2, 9.4, 9.6, 9.8, 10.0,
         10.2, 10.4, 10.6, 10.8, 11.0, 11.2, 11.4, 11.6,
         11.8, 12.0, 12.2, 12.4, 12.6, 12.8, 13.0, 13.2,
         13.4, 13.6, 13.8, 14.0, 14.2, 14.4, 14.6, 14.8,
         15.0, 15.2, 15.4, 15.6, 15.8, 8.0, 8.2, 8.4,
-    ]
-    _PHASES = [
+    )
+    _PHASES = (
         1.5, 0.0, 0.5, 1.0, 1.5, 0.0, 0.5, 1.0,
         1.5, 0.0, 0.5, 1.0, 1.5, 0.0, 0.5, 1.0,
         1.5, 0.0, 0.5, 1.0, 1.5, 0.0, 0.5, 1.0,
         1.5, 0.0, 0.5, 1.0, 1.5, 0.0, 0.5, 1.0,
         1.5, 0.0, 0.5, 1.0, 1.5, 0.0, 0.5, 1.0,
-    ]
+    )
 
     _EVENTS = {str(freq): (i + 1, (0, 2)) for i, freq in enumerate(_FREQS)}
 
-    def __init__(self):
+    def __init__(self, cache_runs: bool = False):
         super().__init__(
             dataset_code="beta",
             subjects=list(range(1, 71)),
@@ -275,6 +509,12 @@ class BETA(BaseDataset):
             srate=250,
             paradigm="ssvep",
         )
+        # resolved local files of loaded subjects
+        self._subject_dests: Dict[Union[str, int], List[List[Union[str, Path]]]] = dict()
+        self.cache_runs = cache_runs
+
+    def _get_path_sign(self) -> str:
+        return "tsinghua"
 
     def data_path(
         self,
@@ -289,6 +529,118 @@ class BETA(BaseDataset):
             raise ValueError("Invalid subject id")
 
         subject = cast(int, subject)
+        file_dest = self._fetch_archive(
+            subject,
+            path=path,
+            force_update=force_update,
+            update_path=update_path,
+            proxies=proxies,
+            verbose=verbose,
+        )
+        # only this subject is extracted, which suits loading a few subjects
+        # but decompresses the archive again for each of them, prefetch
+        # extracts all requested subjects of an archive in one pass instead
+        subject_file = self._extract_subjects(file_dest, [subject])[0]
+        dests: List[List[Union[str, Path]]] = [[subject_file]]
+        return dests
+
+    def _get_archive_key(self, subject: Union[int, str]) -> str:
+        return self._get_archive_name(cast(int, subject))
+
+    def _prefetch_group(
+        self,
+        subjects: List[Union[int, str]],
+        path: Optional[Union[str, Path]] = None,
+        force_update: bool = False,
+        update_path: Optional[bool] = None,
+        proxies: Optional[Dict[str, str]] = None,
+        verbose: Optional[Union[bool, str, int]] = None,
+    ):
+        for subject in subjects:
+            if subject not in self.subjects:
+                raise ValueError("Invalid subject id")
+
+        file_dest = self._fetch_archive(
+            cast(int, subjects[0]),
+            path=path,
+            force_update=force_update,
+            update_path=update_path,
+            proxies=proxies,
+            verbose=verbose,
+        )
+        self._extract_subjects(file_dest, [cast(int, subject) for subject in subjects])
+
+    def _fetch_archive(
+        self,
+        subject: int,
+        path: Optional[Union[str, Path]] = None,
+        force_update: bool = False,
+        update_path: Optional[bool] = None,
+        proxies: Optional[Dict[str, str]] = None,
+        verbose: Optional[Union[bool, str, int]] = None,
+    ) -> str:
+        url = "{:s}{:s}".format(BETA_URL, self._get_archive_name(subject))
+        file_dest = mne_data_path(
+            url,
+            "tsinghua",
+            path=path,
+            proxies=proxies,
+            force_update=force_update,
+            update_path=update_path,
+            verbose=verbose,
+        )
+        return file_dest
+
+    def _extract_subjects(self, file_dest: str, subjects: List[int]) -> List[str]:
+        """Extract the mat files of subjects missing next to the archive.
+
+        All of them are extracted in a single pass over the gzip stream,
+        which stops as soon as the last one is found.
+
+        Parameters
+        ----------
+        file_dest : str
+            local path of the archive
+        subjects : List[int]
+            subjects stored in the archive
+
+        Returns
+        -------
+        List[str]
+            mat file of each subject
+
+        Raises
+        ------
+        FileNotFoundError
+            raise error if a subject is not in the archive
+        """
+        parent_dir = Path(file_dest).parent
+        subject_files = [
+            os.path.join(parent_dir, "S{:d}.mat".format(subject))
+            for subject in subjects
+        ]
+        missing = {
+            os.path.basename(subject_file)
+            for subject_file in subject_files
+            if not os.path.exists(subject_file)
+        }
+        if missing:
+            # decompression the data
+            with tarfile.open(file_dest, "r:gz") as archive:
+                for member in archive:
+                    member_name = os.path.normpath(member.name)
+                    if member_name in missing:
+                        archive.extract(member, path=parent_dir)
+                        missing.remove(member_name)
+                        if not missing:
+                            break
+            if missing:
+                raise FileNotFoundError(
+                    "{:s} not found in {:s}".format(", ".join(sorted(missing)), file_dest)
+                )
+        return subject_files
+
+    def _get_archive_name(self, subject: int) -> str:
         if subject < 11:
             archive_name = "S1-S10.tar.gz"
         elif subject < 21:
@@ -303,64 +655,25 @@ class BETA(BaseDataset):
             archive_name = "S51-S60.tar.gz"
         else:
             archive_name = "S61-S70.tar.gz"
-
-        url = "{:s}{:s}".format(BETA_URL, archive_name)
-
-        file_dest = mne_data_path(
-            url,
-            "tsinghua",
-            path=path,
-            proxies=proxies,
-            force_update=force_update,
-            update_path=update_path,
-        )
-
-        parent_dir = Path(file_dest).parent
-        subject_file = os.path.join(parent_dir, "S{:d}.mat".format(subject))
-
-        if not os.path.exists(subject_file):
-            # decompression the data
-            with tarfile.open(file_dest, "r:gz") as archive:
-                archive.extractall(path=parent_dir)
-        dests: List[List[Union[str, Path]]] = [[subject_file]]
-        return dests
+        return archive_name
 
     def _get_single_subject_data(
         self, subject: Union[str, int], verbose: Optional[Union[bool, str, int]] = None
     ) -> Dict[str, Dict[str, Raw]]:
-        dests = self.data_path(subject)
-        raw_mat = loadmat(dests[0][0])
-        epoch_data = raw_mat["data"]["EEG"] * 1e-6
-        stim = np.zeros((1, *epoch_data.shape[1:]))
-        # 0.5s latency
-        stim[0, 125] = np.tile(np.arange(1, 41), (epoch_data.shape[-2], 1))
-        epoch_data = np.concatenate((epoch_data, stim), axis=0)
-        data = np.transpose(epoch_data, (0, 3, 2, 1))
-
-        montage = make_standard_montage("standard_1005")
-        montage.rename_channels(
-            {ch_name: ch_name.upper() for ch_name in montage.ch_names}
+        # skip data_path, which stats the download and archive, once the
+        # subject file is known; a file that went missing goes back through
+        # data_path, which extracts it again
+        dests = self._subject_dests.get(subject)
+        if dests is None or not os.path.exists(dests[0][0]):
+            dests = self.data_path(subject)
+            self._subject_dests[subject] = dests
+        runs = _load_runs(
+            dests[0][0],
+            lambda mat_file: loadmat(mat_file, variable_names=["data"])["data"]["EEG"],
+            block_axis=2,
+            srate=self.srate,
+            cache_runs=self.cache_runs,
         )
-        ch_names = [ch_name.upper() for ch_name in self._CHANNELS]
-        ch_names.insert(32, "M1")
-        ch_names.insert(42, "M2")
-        ch_names.insert(59, "CB1")
-        ch_names = ch_names + ["CB2", "STI 014"]
-        ch_types = ["eeg"] * 65
-        ch_types[59] = "misc"
-        ch_types[63] = "misc"
-        ch_types[-1] = "stim"
-
-        info = create_info(ch_names=ch_names,
-                           ch_types=ch_types, sfreq=self.srate)
-
-        runs = dict()
-        for i in range(data.shape[-2]):
-            raw_data = np.reshape(data[..., i, :], (data.shape[0], -1))
-            raw = RawArray(data=raw_data, info=info)
-            raw.set_montage(montage)
-            runs["run_{:d}".format(i)] = raw
-
         sess = {"session_0": runs}
         return sess
 
@@ -149,6 +149,19 @@ class Weibo2014(BaseDataset):
             paradigm="imagery",
         )
 
+    def _get_archive_key(self, subject: Union[int, str]) -> str:
+        # subjects 1-4, 5-7 and 8-10 each share one zip file
+        subject = cast(int, subject)
+        if subject in range(1, 5):
+            return Weibo2014_URLs[0]
+        elif subject in range(5, 8):
+            return Weibo2014_URLs[1]
+        else:
+            return Weibo2014_URLs[2]
+
+    def _get_path_sign(self) -> str:
+        return "tunerl"
+
     def data_path(
         self,
         subject: Union[str, int],
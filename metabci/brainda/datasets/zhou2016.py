@@ -78,6 +78,10 @@ class Zhou2016(BaseDataset):
             paradigm="imagery",
         )
 
+    def _get_archive_key(self, subject: Union[int, str]) -> str:
+        # all subjects share one zip file
+        return ZHOU_URL
+
     def data_path(
         self,
         subject: Union[str, int],
@@ -1,3 +1,3 @@
 from .channels import pick_channels, upper_ch_names
-from .download import mne_data_path
+from .download import mne_data_path, mne_update_path
 from .io import loadmat
@@ -165,3 +165,31 @@ def mne_data_path(
 
     _do_path_update(path, update_path, key, sign)
     return destination
+
+
+def mne_update_path(
+    sign: str,
+    path: Optional[Union[str, Path]] = None,
+    update_path: bool = True,
+) -> str:
+    """Resolve the local data folder and update mne config like mne_data_path, without fetching.
+
+    Parameters
+    ----------
+    sign : str
+        the unique identifier to which the file belongs
+    path : Optional[Union[str, Path]], optional
+        local folder to save the file, by default None
+    update_path : bool, optional
+        whether to update mne config, by default True
+
+    Returns
+    -------
+    str
+        local folder of the data
+    """
+    sign = sign.upper()
+    key = "MNE_DATASETS_{:s}_PATH".format(sign)
+    path = str(_get_path(path, key, sign))
+    _do_path_update(path, update_path, key, sign)
+    return path
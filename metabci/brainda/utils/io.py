@@ -3,7 +3,7 @@
 # Authors: Swolf <swolfforever@gmail.com>
 # Date: 2020/12/30
 # License: MIT License
-from typing import Union
+from typing import Union, Optional, List
 from pathlib import Path
 
 import numpy as np
@@ -11,13 +11,18 @@ import scipy.io as sio
 import mat73
 
 
-def loadmat(mat_file: Union[str, Path]) -> dict:
+def loadmat(
+    mat_file: Union[str, Path], variable_names: Optional[List[str]] = None
+) -> dict:
     """Wrapper of scipy.io loadmat function, works for matv7.3.
 
     Parameters
     ----------
     mat_file : Union[str, Path]
         file path
+    variable_names : Optional[List[str]], optional
+        names of the variables to read, other variables in the file are
+        skipped, by default None (read all)
 
     Returns
     -------
@@ -25,13 +30,16 @@ def loadmat(mat_file: Union[str, Path]) -> dict:
         data
     """
     try:
-        data = _loadmat(mat_file)
+        data = _loadmat(mat_file, variable_names=variable_names)
     except Exception:
-        data = mat73.loadmat(mat_file)
+        if variable_names is None:
+            data = mat73.loadmat(mat_file)
+        else:
+            data = mat73.loadmat(mat_file, only_include=variable_names)
     return data
 
 
-def _loadmat(filename):
+def _loadmat(filename, variable_names=None):
     """
     this function should be called instead of direct sio.loadmat
     as it cures the problem of not properly recovering python dictionaries
@@ -87,5 +95,10 @@ def _loadmat(filename):
         else:
             return ndarray
 
-    data = sio.loadmat(filename, struct_as_record=False, squeeze_me=True)
+    data = sio.loadmat(
+        filename,
+        struct_as_record=False,
+        squeeze_me=True,
+        variable_names=variable_names,
+    )
     return _check_keys(data)
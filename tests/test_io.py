@@ -0,0 +1,25 @@
+from .base_tmpl import BaseTmpl
+import os
+import tempfile
+
+import numpy as np
+import scipy.io as sio
+
+from metabci.brainda.utils import loadmat
+
+
+class TestLoadmat(BaseTmpl):
+
+    def test_variable_names(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mat_file = os.path.join(tmpdir, "S1.mat")
+            data = np.arange(24, dtype=np.float64).reshape(2, 3, 4)
+            sio.savemat(mat_file, {"data": data, "freqs": np.arange(4)})
+
+            mat = loadmat(mat_file, variable_names=["data"])
+            self.assertIn("data", mat)
+            self.assertNotIn("freqs", mat)
+            np.testing.assert_array_equal(data, mat["data"])
+
+            mat = loadmat(mat_file)
+            self.assertIn("freqs", mat)
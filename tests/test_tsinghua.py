@@ -0,0 +1,162 @@
+from .base_tmpl import BaseTmpl
+import os
+import tarfile
+import tempfile
+from unittest import mock
+
+import numpy as np
+import scipy.io as sio
+
+from metabci.brainda.datasets import Wang2016, BETA
+from metabci.brainda.datasets import tsinghua
+
+
+def _save_wang2016_mat(mat_file, n_times=150, n_trials=40, n_blocks=2, seed=0):
+    # channels x time points x targets x blocks, in microvolts
+    rng = np.random.default_rng(seed)
+    epoch_data = rng.standard_normal((64, n_times, n_trials, n_blocks)) * 10
+    sio.savemat(mat_file, {"data": epoch_data, "freqs": np.arange(n_trials)})
+    return epoch_data
+
+
+def _save_beta_mat(mat_file, n_times=150, n_blocks=2, n_trials=40, seed=0):
+    # channels x time points x blocks x conditions, in microvolts
+    rng = np.random.default_rng(seed)
+    epoch_data = rng.standard_normal((64, n_times, n_blocks, n_trials)) * 10
+    sio.savemat(mat_file, {"data": {"EEG": epoch_data, "suppl_info": {"srate": 250.0}}})
+    return epoch_data
+
+
+def _naive_runs(blocks):
+    """Concatenate the trials of each (n_channels, n_times, n_trials) block."""
+    runs = []
+    for block in blocks:
+        n_channels, n_times, n_trials = block.shape
+        eeg = np.concatenate([block[..., i] for i in range(n_trials)], axis=1) * 1e-6
+        stim = np.zeros((1, n_trials * n_times))
+        for i in range(n_trials):
+            stim[0, i * n_times + 125] = i + 1
+        runs.append(np.concatenate([eeg, stim], axis=0))
+    return runs
+
+
+class TestBETAArchive(BaseTmpl):
+
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.data_dir = self.tmpdir.name
+        # one archive per subject range, the real ones hold ten subjects each
+        self.archives = dict()
+        for archive_name, subjects in [("S1-S10.tar.gz", [1, 2, 3]),
+                                       ("S11-S20.tar.gz", [11])]:
+            src_dir = os.path.join(self.data_dir, "src", archive_name)
+            os.makedirs(src_dir)
+            archive_file = os.path.join(self.data_dir, archive_name)
+            with tarfile.open(archive_file, "w:gz") as archive:
+                for subject in subjects:
+                    mat_file = os.path.join(src_dir, "S{:d}.mat".format(subject))
+                    _save_beta_mat(mat_file, seed=subject)
+                    archive.add(mat_file, arcname=os.path.basename(mat_file))
+            self.archives[archive_name] = archive_file
+
+        self.dataset = BETA()
+        self.fetched = []
+
+        def fetch_archive(subject, **kwargs):
+            archive_name = self.dataset._get_archive_name(subject)
+            self.fetched.append(archive_name)
+            return self.archives[archive_name]
+
+        patcher = mock.patch.object(self.dataset, "_fetch_archive", side_effect=fetch_archive)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+        super().tearDown()
+
+    def _extracted(self):
+        return sorted(f for f in os.listdir(self.data_dir) if f.endswith(".mat"))
+
+    def test_data_path_extracts_requested_member(self):
+        dests = self.dataset.data_path(2)
+        self.assertEqual([[os.path.join(self.data_dir, "S2.mat")]], dests)
+        self.assertEqual(["S2.mat"], self._extracted())
+
+        # an extracted subject is not read from the archive again
+        with mock.patch("tarfile.open", side_effect=AssertionError("archive opened")):
+            self.assertEqual(dests, self.dataset.data_path(2))
+
+    def test_data_path_missing_member(self):
+        with self.assertRaisesRegex(FileNotFoundError, "S4.mat not found in"):
+            self.dataset.data_path(4)
+        self.assertEqual([], self._extracted())
+
+    def test_extract_subjects_single_pass(self):
+        with mock.patch("tarfile.open", wraps=tarfile.open) as tar_open:
+            subject_files = self.dataset._extract_subjects(
+                self.archives["S1-S10.tar.gz"], [1, 3])
+        self.assertEqual(1, tar_open.call_count)
+        self.assertEqual(
+            [os.path.join(self.data_dir, "S1.mat"), os.path.join(self.data_dir, "S3.mat")],
+            subject_files)
+        self.assertEqual(["S1.mat", "S3.mat"], self._extracted())
+
+    def test_prefetch_fetches_each_archive_once(self):
+        with mock.patch("metabci.brainda.datasets.base.mne_update_path") as update_path:
+            self.dataset.prefetch([1, 11, 3, 2], n_jobs=1)
+        update_path.assert_called_once_with("tsinghua", path=None, update_path=True)
+        self.assertEqual(["S1-S10.tar.gz", "S11-S20.tar.gz"], sorted(self.fetched))
+        self.assertEqual(["S1.mat", "S11.mat", "S2.mat", "S3.mat"], self._extracted())
+
+    def test_prefetch_invalid_subject(self):
+        with self.assertRaisesRegex(ValueError, "Invalid subject"):
+            self.dataset.prefetch(["1"], n_jobs=1)
+        self.assertEqual([], self.fetched)
+
+
+class TestTsinghuaRuns(BaseTmpl):
+
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.mat_file = os.path.join(self.tmpdir.name, "S1.mat")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+        super().tearDown()
+
+    def _check_runs(self, dataset, expected_runs):
+        with mock.patch.object(dataset, "data_path", return_value=[[self.mat_file]]):
+            runs = dataset._get_single_subject_data(1)["session_0"]
+        self.assertEqual(["run_{:d}".format(i) for i in range(len(expected_runs))], list(runs))
+        for raw, expected in zip(runs.values(), expected_runs):
+            np.testing.assert_array_equal(expected, raw.get_data())
+            self.assertEqual(list(tsinghua._CH_NAMES), raw.ch_names)
+            self.assertEqual(
+                ["eeg"] * 59 + ["misc", "eeg", "eeg", "eeg", "misc", "stim"],
+                raw.get_channel_types())
+            self.assertEqual("STI 014", raw.ch_names[-1])
+            self.assertEqual(dataset.srate, raw.info["sfreq"])
+
+    def _check_cached_runs(self, dataset, expected_runs):
+        self._check_runs(dataset, expected_runs)
+        self.assertFileExists(tsinghua._runs_cache_file(self.mat_file))
+        # the second load is served by the cache alone
+        with mock.patch.object(tsinghua, "loadmat", side_effect=AssertionError("mat read")):
+            self._check_runs(dataset, expected_runs)
+
+    def test_wang2016_runs(self):
+        epoch_data = _save_wang2016_mat(self.mat_file)
+        expected_runs = _naive_runs([epoch_data[..., i] for i in range(epoch_data.shape[3])])
+        self._check_runs(Wang2016(), expected_runs)
+        self.assertFileNotExist(tsinghua._runs_cache_file(self.mat_file))
+        self._check_cached_runs(Wang2016(cache_runs=True), expected_runs)
+
+    def test_beta_runs(self):
+        epoch_data = _save_beta_mat(self.mat_file)
+        expected_runs = _naive_runs([epoch_data[:, :, i] for i in range(epoch_data.shape[2])])
+        self._check_runs(BETA(), expected_runs)
+        self.assertFileNotExist(tsinghua._runs_cache_file(self.mat_file))
+        self._check_cached_runs(BETA(cache_runs=True), expected_runs)